@@ -9,17 +9,72 @@ Priority: HIGH (Severity 2) - Enhanced crew medical capabilities
 """
 
 import numpy as np
+import sys
 import json
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Tuple, Optional, Union
+import functools
+from math import sqrt
+from dataclasses import dataclass, field, fields
+from typing import Dict, Iterator, List, Tuple, Optional, Union
 from enum import Enum
 import logging
-from datetime import datetime, timedelta
+from pathlib import Path
+from types import MappingProxyType
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library encoder
+    orjson = None
+
+try:
+    import numba
+except ImportError:
+    # Library validation falls back to the NumPy reduction
+    numba = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _json_default(obj):
+    """JSON encoder fallback for protocol records"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    if isinstance(obj, datetime):
+        # Naive timestamps are UTC, matching orjson.OPT_NAIVE_UTC
+        return (obj if obj.tzinfo else obj.replace(tzinfo=timezone.utc)).isoformat()
+    return str(obj)
+
+def _dumps(obj, indent: bool = False) -> bytes:
+    """Serialize protocol records to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        option = (orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS |
+                  orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default).encode()
+
+def dumps_framework(framework: Dict, indent: bool = False) -> bytes:
+    """
+    Serialize a comprehensive protocol framework to JSON bytes
+    
+    Uses orjson when it is installed; call .decode() for a str.
+    """
+    return _dumps(framework, indent=indent)
+
+def loads_framework(data: Union[bytes, str]) -> Dict:
+    """Load a framework checkpoint written by dumps_framework"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class MedicalCondition(Enum):
     """Medical conditions treatable with graviton therapy"""
     BONE_DENSITY_LOSS = "bone_density_loss"
@@ -49,7 +104,330 @@ class SafetyLevel(Enum):
     STANDARD = "standard"                      # 10¹⁰ safety margin
     RESEARCH = "research"                      # 10⁸ safety margin
 
-@dataclass
+# Required biological safety margin for each safety level
+_SAFETY_THRESHOLDS = MappingProxyType({
+    SafetyLevel.ULTRA_CONSERVATIVE: 1e14,
+    SafetyLevel.CONSERVATIVE: 1e12,
+    SafetyLevel.STANDARD: 1e10,
+    SafetyLevel.RESEARCH: 1e8
+})
+
+# Base dosimetry parameters by condition; conditions without a dedicated
+# entry fall back to the default parameters
+_DEFAULT_BASE_PARAMETERS = {
+    'field_strength': 1e-9,
+    'base_duration': 30,
+    'frequency': None,
+    'gradient': 1e-12
+}
+_CONDITION_BASE_PARAMETERS = {
+    MedicalCondition.BONE_DENSITY_LOSS: {
+        'field_strength': 5e-9,    # 5 nT
+        'base_duration': 30,       # 30 minutes
+        'frequency': None,         # Continuous field
+        'gradient': 1e-12          # Weak gradient
+    },
+    MedicalCondition.MUSCLE_ATROPHY: {
+        'field_strength': 3e-9,    # 3 nT
+        'base_duration': 45,       # 45 minutes
+        'frequency': 10.0,         # 10 Hz pulsed
+        'gradient': 5e-12          # Moderate gradient
+    },
+    MedicalCondition.CARDIOVASCULAR_DECONDITIONING: {
+        'field_strength': 2e-9,    # 2 nT (sensitive system)
+        'base_duration': 20,       # 20 minutes
+        'frequency': 1.0,          # 1 Hz cardiac rhythm
+        'gradient': 2e-12          # Gentle gradient
+    },
+    MedicalCondition.WOUND_HEALING: {
+        'field_strength': 8e-9,    # 8 nT (localized)
+        'base_duration': 60,       # 60 minutes
+        'frequency': None,         # Continuous
+        'gradient': 1e-11          # Strong gradient
+    },
+    MedicalCondition.PAIN_MANAGEMENT: {
+        'field_strength': 1e-9,    # 1 nT (neural sensitivity)
+        'base_duration': 15,       # 15 minutes
+        'frequency': 100.0,        # 100 Hz neural blocking
+        'gradient': 5e-13          # Minimal gradient
+    },
+    MedicalCondition.NEURAL_REGENERATION: {
+        'field_strength': 5e-10,   # 0.5 nT (ultra-sensitive)
+        'base_duration': 90,       # 90 minutes
+        'frequency': 40.0,         # 40 Hz gamma waves
+        'gradient': 1e-13          # Ultra-weak gradient
+    }
+}
+_BASE_PARAMETERS = MappingProxyType({
+    condition: MappingProxyType(_CONDITION_BASE_PARAMETERS.get(condition, _DEFAULT_BASE_PARAMETERS))
+    for condition in MedicalCondition
+})
+
+# Protocol validation criteria as bit flags
+VALID_DOSIMETRY = 0x01
+VALID_SCHEDULE = 0x02
+VALID_MONITORING = 0x04
+VALID_ENDPOINTS = 0x08
+VALID_SAFETY = 0x10
+VALID_ALL = 0x1F
+
+# Criterion report names paired with their bit flags, in report order
+_VALIDATION_CRITERIA = (
+    ('dosimetry_safe', VALID_DOSIMETRY),
+    ('schedule_feasible', VALID_SCHEDULE),
+    ('monitoring_adequate', VALID_MONITORING),
+    ('endpoints_defined', VALID_ENDPOINTS),
+    ('safety_complete', VALID_SAFETY)
+)
+
+# Criterion names and flags as columns of the library validation matrix
+_CRITERIA_NAMES = tuple(name for name, _ in _VALIDATION_CRITERIA)
+_CRITERIA_FLAGS = np.array([flag for _, flag in _VALIDATION_CRITERIA], dtype=np.uint8)
+
+def _aggregate_scores(criteria: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Per-protocol scores, pass mask and pass count of a protocols x criteria matrix"""
+    scores = criteria.mean(axis=1)
+    passed = scores >= 0.8
+    return scores, passed, int(np.count_nonzero(passed))
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _aggregate_scores(criteria):
+        """Per-protocol scores, pass mask and pass count of a protocols x criteria matrix"""
+        n, k = criteria.shape
+        scores = np.empty(n)
+        passed = np.empty(n, dtype=np.bool_)
+        protocols_passed = 0
+        for i in range(n):
+            total = 0.0
+            for j in range(k):
+                total += criteria[i, j]
+            scores[i] = total / k
+            passed[i] = scores[i] >= 0.8
+            if passed[i]:
+                protocols_passed += 1
+        return scores, passed, protocols_passed
+
+def _interned(*strings: str) -> Tuple[str, ...]:
+    """Immutable tuple of interned strings shared by every protocol"""
+    return tuple(sys.intern(s) for s in strings)
+
+# Requirement lists common to every protocol
+_GENERAL_CONTRAINDICATIONS = _interned(
+    "Pregnancy",
+    "Active cancer (unless specifically approved)",
+    "Severe cardiac arrhythmias",
+    "Active bleeding disorders",
+    "Acute infectious disease",
+    "Severe psychiatric conditions"
+)
+
+_BASELINE_MONITORING = _interned(
+    "Vital signs (HR, BP, RR, SpO2) before, during, and after treatment",
+    "Patient comfort and subjective response assessment",
+    "Real-time graviton field strength monitoring",
+    "Emergency stop system verification",
+    "Adverse event documentation"
+)
+
+_PRE_TREATMENT_CHECKS = _interned(
+    "Patient identity verification",
+    "Informed consent confirmation",
+    "Contraindication screening",
+    "Baseline vital signs",
+    "Equipment calibration verification",
+    "Emergency equipment check"
+)
+
+_POST_TREATMENT_MONITORING = _interned(
+    "Immediate post-treatment vital signs",
+    "Symptom assessment",
+    "Adverse event screening",
+    "Treatment response documentation",
+    "Next session scheduling",
+    "Patient education reinforcement"
+)
+
+# Extra monitoring for doses whose safety margin is below _ENHANCED_MONITORING_MARGIN
+_ENHANCED_MONITORING_MARGIN = 1e12
+_ENHANCED_MONITORING = _interned(
+    "Enhanced continuous monitoring",
+    "Laboratory safety biomarkers",
+    "Physician presence required"
+)
+
+def _table(members, entries: Dict, default: Tuple[str, ...] = ()) -> MappingProxyType:
+    """Read-only lookup of interned string tuples with an entry for every enum member"""
+    return MappingProxyType({
+        member: _interned(*entries.get(member, default)) for member in members
+    })
+
+# Condition- and modality-specific requirement tables
+_CONDITION_CONTRAINDICATIONS = _table(MedicalCondition, {
+    MedicalCondition.CARDIOVASCULAR_DECONDITIONING: (
+        "Acute myocardial infarction (within 6 weeks)",
+        "Unstable angina",
+        "Severe heart failure (NYHA Class IV)",
+        "Uncontrolled hypertension (>180/110 mmHg)"
+    ),
+    MedicalCondition.NEURAL_REGENERATION: (
+        "Active seizure disorder",
+        "Brain tumor",
+        "Recent stroke (within 3 months)",
+        "Implanted neural devices without compatibility testing"
+    ),
+    MedicalCondition.BONE_DENSITY_LOSS: (
+        "Recent fracture at treatment site",
+        "Active bone infection",
+        "Bone metastases",
+        "Severe osteomalacia"
+    )
+})
+
+_MODALITY_CONTRAINDICATIONS = _table(TreatmentModality, {
+    TreatmentModality.PULSED_THERAPY: (
+        "Epilepsy or seizure history",
+        "Cochlear implants"
+    ),
+    TreatmentModality.GRADIENT_THERAPY: (
+        "Metallic implants in treatment field",
+        "Pacemaker or ICD (without compatibility verification)"
+    )
+})
+
+_CONDITION_MONITORING = _table(MedicalCondition, {
+    MedicalCondition.CARDIOVASCULAR_DECONDITIONING: (
+        "Continuous ECG monitoring during treatment",
+        "Blood pressure monitoring every 10 minutes",
+        "Exercise tolerance testing pre/post treatment"
+    ),
+    MedicalCondition.NEURAL_REGENERATION: (
+        "Neurological examination before and after each session",
+        "EEG monitoring during treatment (if indicated)",
+        "Cognitive function assessment"
+    ),
+    MedicalCondition.BONE_DENSITY_LOSS: (
+        "Pain scale assessment",
+        "Range of motion measurement",
+        "Bone density scans (monthly)"
+    ),
+    MedicalCondition.WOUND_HEALING: (
+        "Wound measurement and photography",
+        "Infection signs assessment",
+        "Tissue perfusion monitoring"
+    )
+})
+
+_EFFICACY_ENDPOINTS = _table(MedicalCondition, {
+    MedicalCondition.BONE_DENSITY_LOSS: (
+        "Bone mineral density increase (DEXA scan)",
+        "Reduced fracture risk score",
+        "Improved trabecular bone score",
+        "Decreased bone turnover markers"
+    ),
+    MedicalCondition.MUSCLE_ATROPHY: (
+        "Increased muscle mass (MRI or DEXA)",
+        "Improved muscle strength (dynamometry)",
+        "Enhanced functional capacity",
+        "Reduced muscle fatigue"
+    ),
+    MedicalCondition.CARDIOVASCULAR_DECONDITIONING: (
+        "Improved exercise tolerance (VO2 max)",
+        "Enhanced cardiac output",
+        "Reduced resting heart rate",
+        "Improved vascular compliance"
+    ),
+    MedicalCondition.WOUND_HEALING: (
+        "Accelerated wound closure rate",
+        "Improved tissue granulation",
+        "Reduced inflammation markers",
+        "Enhanced angiogenesis"
+    ),
+    MedicalCondition.PAIN_MANAGEMENT: (
+        "Reduced pain scores (VAS/NRS)",
+        "Decreased analgesic requirements",
+        "Improved quality of life scores",
+        "Enhanced sleep quality"
+    ),
+    MedicalCondition.NEURAL_REGENERATION: (
+        "Improved neurological function scores",
+        "Enhanced nerve conduction velocity",
+        "Increased brain-derived neurotrophic factor",
+        "Improved cognitive assessment scores"
+    )
+}, default=(
+    "Clinical improvement in target condition",
+    "Improved quality of life measures",
+    "Reduced symptom severity"
+))
+
+# Safety protocols shared by every therapeutic protocol
+_SAFETY_TEMPLATE = MappingProxyType({
+    'emergency_stop': MappingProxyType({
+        'automatic_triggers': (
+            'Field strength exceeds 110% of prescribed dose',
+            'Patient vital signs outside normal ranges',
+            'Equipment malfunction detected',
+            'Patient reports severe discomfort'
+        ),
+        'manual_triggers': (
+            'Patient request',
+            'Clinician observation of adverse effects',
+            'Emergency medical situation'
+        ),
+        'response_time': '<1 second automatic, <5 seconds manual',
+        'post_stop_procedures': (
+            'Immediate patient assessment',
+            'Vital signs monitoring',
+            'Incident documentation',
+            'Medical evaluation if indicated'
+        )
+    }),
+    'adverse_event': MappingProxyType({
+        'classification': (
+            'Mild: No intervention required',
+            'Moderate: Medical evaluation needed',
+            'Severe: Immediate medical intervention',
+            'Life-threatening: Emergency response'
+        ),
+        'reporting_timeline': MappingProxyType({
+            'mild': '24 hours',
+            'moderate': '4 hours', 
+            'severe': '1 hour',
+            'life_threatening': 'Immediate'
+        }),
+        'documentation_requirements': (
+            'Detailed event description',
+            'Treatment parameters at time of event',
+            'Patient response and interventions',
+            'Outcome and follow-up plan'
+        )
+    }),
+    'monitoring': MappingProxyType({
+        'frequency': 'Continuous during treatment',
+        'parameters': (
+            'Graviton field strength and uniformity',
+            'Patient vital signs',
+            'Subjective symptom reports',
+            'Environmental conditions'
+        ),
+        'alarm_limits': MappingProxyType({
+            'field_strength_variance': '±5%',
+            'heart_rate': 'Age-appropriate ±20%',
+            'blood_pressure': '±20% from baseline',
+            'oxygen_saturation': '>95%'
+        }),
+        'data_logging': 'All parameters recorded every 10 seconds'
+    }),
+    'quality_assurance': MappingProxyType({
+        'equipment_calibration': 'Daily before first use',
+        'staff_training': 'Annual certification required',
+        'protocol_adherence': 'Real-time compliance monitoring',
+        'outcome_tracking': 'Comprehensive database maintenance'
+    })
+})
+
+@dataclass(slots=True)
 class GravitonDosimetry:
     """Graviton field dosimetry parameters"""
     field_strength_tesla: float          # Graviton field strength
@@ -58,20 +436,27 @@ class GravitonDosimetry:
     gradient_strength_t_m: Optional[float] # Field gradient strength
     total_dose_t_min: float              # Total accumulated dose
     safety_margin: float                 # Biological safety margin
+    _enhanced_monitoring: bool = field(init=False, repr=False, compare=False)  # Margin calls for enhanced monitoring
+    
+    def __post_init__(self):
+        self._enhanced_monitoring = self.safety_margin < _ENHANCED_MONITORING_MARGIN
     
     def validate_safety(self, safety_level: SafetyLevel) -> bool:
         """Validate dosimetry meets safety requirements"""
-        safety_thresholds = {
-            SafetyLevel.ULTRA_CONSERVATIVE: 1e14,
-            SafetyLevel.CONSERVATIVE: 1e12,
-            SafetyLevel.STANDARD: 1e10,
-            SafetyLevel.RESEARCH: 1e8
+        return self.safety_margin >= _SAFETY_THRESHOLDS[safety_level]
+    
+    def to_dict(self) -> Dict:
+        """Plain dict of dosimetry fields"""
+        return {
+            'field_strength_tesla': self.field_strength_tesla,
+            'exposure_duration_minutes': self.exposure_duration_minutes,
+            'frequency_hz': self.frequency_hz,
+            'gradient_strength_t_m': self.gradient_strength_t_m,
+            'total_dose_t_min': self.total_dose_t_min,
+            'safety_margin': self.safety_margin
         }
-        
-        required_margin = safety_thresholds[safety_level]
-        return self.safety_margin >= required_margin
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TherapeuticProtocol:
     """Complete therapeutic protocol for specific condition"""
     condition: MedicalCondition
@@ -83,54 +468,116 @@ class TherapeuticProtocol:
     efficacy_endpoints: List[str]
     safety_protocols: Dict
     
+    def validation_bits(self) -> int:
+        """Validate complete therapeutic protocol as a VALID_* bitmask"""
+        return (
+            VALID_DOSIMETRY * bool(self.dosimetry.validate_safety(SafetyLevel.CONSERVATIVE)) |
+            VALID_SCHEDULE * (len(self.treatment_schedule.get('sessions', [])) > 0) |
+            VALID_MONITORING * (len(self.monitoring_requirements) >= 3) |
+            VALID_ENDPOINTS * (len(self.efficacy_endpoints) >= 2) |
+            VALID_SAFETY * ('emergency_stop' in self.safety_protocols and
+                            'adverse_event' in self.safety_protocols and
+                            'monitoring' in self.safety_protocols)
+        )
+    
     def validate_protocol(self) -> Dict[str, bool]:
         """Validate complete therapeutic protocol"""
+        bits = self.validation_bits()
+        return {name: bool(bits & flag) for name, flag in _VALIDATION_CRITERIA}
+    
+    def validation_score(self) -> float:
+        """Fraction of validation criteria satisfied"""
+        return self.validation_bits().bit_count() / len(_VALIDATION_CRITERIA)
+    
+    def __getstate__(self):
+        """
+        Field values for worker processes
+        
+        The shared safety template is sent by reference, and the read-only
+        session dosimetry views are sent as plain dicts, one per shared view.
+        """
+        state = {f.name: getattr(self, f.name) for f in fields(self)}
+        if state['safety_protocols'] is _SAFETY_TEMPLATE:
+            state['safety_protocols'] = None
+        
+        schedule = state['treatment_schedule']
+        if schedule.get('sessions'):
+            thawed = {}
+            sessions = []
+            for session in schedule['sessions']:
+                dose = session['dosimetry']
+                if isinstance(dose, MappingProxyType):
+                    if id(dose) not in thawed:
+                        thawed[id(dose)] = dict(dose)
+                    session = {**session, 'dosimetry': thawed[id(dose)]}
+                sessions.append(session)
+            state['treatment_schedule'] = {**schedule, 'sessions': sessions}
+        return state
+    
+    def __setstate__(self, state):
+        if state['safety_protocols'] is None:
+            state['safety_protocols'] = _SAFETY_TEMPLATE
+        
+        # Re-wrap the session dosimetry dicts, keeping one view per shared dict
+        frozen = {}
+        for session in state['treatment_schedule'].get('sessions', ()):
+            dose = session['dosimetry']
+            if isinstance(dose, dict):
+                if id(dose) not in frozen:
+                    frozen[id(dose)] = MappingProxyType(dose)
+                session['dosimetry'] = frozen[id(dose)]
+        
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+    
+    def to_dict(self) -> Dict:
+        """JSON-ready dict; container fields are shared with the protocol, not copied"""
         return {
-            'dosimetry_safe': self.dosimetry.validate_safety(SafetyLevel.CONSERVATIVE),
-            'schedule_feasible': len(self.treatment_schedule.get('sessions', [])) > 0,
-            'monitoring_adequate': len(self.monitoring_requirements) >= 3,
-            'endpoints_defined': len(self.efficacy_endpoints) >= 2,
-            'safety_complete': all(key in self.safety_protocols for key in 
-                                 ['emergency_stop', 'adverse_event', 'monitoring'])
+            'condition': self.condition.value,
+            'modality': self.modality.value,
+            'dosimetry': self.dosimetry.to_dict(),
+            'treatment_schedule': self.treatment_schedule,
+            'contraindications': self.contraindications,
+            'monitoring_requirements': self.monitoring_requirements,
+            'efficacy_endpoints': self.efficacy_endpoints,
+            'safety_protocols': self.safety_protocols
         }
 
 class GravitonDosimetryCalculator:
     """Calculate optimal dosimetry for graviton therapeutic applications"""
     
-    def __init__(self):
-        # Biological response thresholds (Tesla)
-        self.cellular_threshold = 1e-12      # Minimum detectable cellular response
-        self.therapeutic_threshold = 1e-10   # Minimum therapeutic effect
-        self.safety_threshold = 1e-6         # Maximum safe exposure
-        
-        # Tissue-specific sensitivity factors
-        self.tissue_sensitivity = {
-            'bone': 0.8,           # Moderate sensitivity
-            'muscle': 1.2,         # High sensitivity
-            'cardiovascular': 1.5,  # Very high sensitivity
-            'neural': 2.0,         # Extreme sensitivity
-            'connective': 0.6,     # Lower sensitivity
-            'immune': 1.0          # Baseline sensitivity
-        }
-        
-        logger.info("Graviton Dosimetry Calculator initialized")
+    # Biological response thresholds (Tesla)
+    cellular_threshold = 1e-12      # Minimum detectable cellular response
+    therapeutic_threshold = 1e-10   # Minimum therapeutic effect
+    safety_threshold = 1e-6         # Maximum safe exposure
     
-    def calculate_therapeutic_dose(self, condition: MedicalCondition, 
+    # Tissue-specific sensitivity factors
+    tissue_sensitivity = MappingProxyType({
+        'bone': 0.8,           # Moderate sensitivity
+        'muscle': 1.2,         # High sensitivity
+        'cardiovascular': 1.5,  # Very high sensitivity
+        'neural': 2.0,         # Extreme sensitivity
+        'connective': 0.6,     # Lower sensitivity
+        'immune': 1.0          # Baseline sensitivity
+    })
+    
+    @classmethod
+    def calculate_therapeutic_dose(cls, condition: MedicalCondition, 
                                  patient_parameters: Dict) -> GravitonDosimetry:
         """Calculate optimal therapeutic dose for specific condition"""
         logger.info(f"Calculating dose for {condition.value}")
         
         # Base dosimetry parameters by condition
-        base_parameters = self._get_base_parameters(condition)
+        base_parameters = cls._get_base_parameters(condition)
         
         # Adjust for patient-specific factors
-        adjusted_parameters = self._adjust_for_patient(base_parameters, patient_parameters)
+        adjusted_parameters = cls._adjust_for_patient(base_parameters, patient_parameters)
         
         # Calculate safety margin
-        safety_margin = self._calculate_safety_margin(adjusted_parameters, patient_parameters)
+        safety_margin = cls._calculate_safety_margin(adjusted_parameters, patient_parameters)
         
         # Optimize treatment duration
-        optimal_duration = self._optimize_duration(adjusted_parameters, condition)
+        optimal_duration = cls._optimize_duration(adjusted_parameters, condition)
         
         # Calculate total dose
         total_dose = adjusted_parameters['field_strength'] * optimal_duration
@@ -147,55 +594,56 @@ class GravitonDosimetryCalculator:
         logger.info(f"Calculated dose: {dosimetry.field_strength_tesla:.2e} T for {dosimetry.exposure_duration_minutes:.1f} min")
         return dosimetry
     
-    def _get_base_parameters(self, condition: MedicalCondition) -> Dict:
-        """Get base dosimetry parameters for medical condition"""
-        base_params = {
-            MedicalCondition.BONE_DENSITY_LOSS: {
-                'field_strength': 5e-9,    # 5 nT
-                'base_duration': 30,       # 30 minutes
-                'frequency': None,         # Continuous field
-                'gradient': 1e-12          # Weak gradient
-            },
-            MedicalCondition.MUSCLE_ATROPHY: {
-                'field_strength': 3e-9,    # 3 nT
-                'base_duration': 45,       # 45 minutes
-                'frequency': 10.0,         # 10 Hz pulsed
-                'gradient': 5e-12          # Moderate gradient
-            },
-            MedicalCondition.CARDIOVASCULAR_DECONDITIONING: {
-                'field_strength': 2e-9,    # 2 nT (sensitive system)
-                'base_duration': 20,       # 20 minutes
-                'frequency': 1.0,          # 1 Hz cardiac rhythm
-                'gradient': 2e-12          # Gentle gradient
-            },
-            MedicalCondition.WOUND_HEALING: {
-                'field_strength': 8e-9,    # 8 nT (localized)
-                'base_duration': 60,       # 60 minutes
-                'frequency': None,         # Continuous
-                'gradient': 1e-11          # Strong gradient
-            },
-            MedicalCondition.PAIN_MANAGEMENT: {
-                'field_strength': 1e-9,    # 1 nT (neural sensitivity)
-                'base_duration': 15,       # 15 minutes
-                'frequency': 100.0,        # 100 Hz neural blocking
-                'gradient': 5e-13          # Minimal gradient
-            },
-            MedicalCondition.NEURAL_REGENERATION: {
-                'field_strength': 5e-10,   # 0.5 nT (ultra-sensitive)
-                'base_duration': 90,       # 90 minutes
-                'frequency': 40.0,         # 40 Hz gamma waves
-                'gradient': 1e-13          # Ultra-weak gradient
-            }
-        }
+    @classmethod
+    def calculate_therapeutic_dose_batch(cls, condition: MedicalCondition,
+                                         patient_batch: Dict[str, np.ndarray]) -> List[GravitonDosimetry]:
+        """
+        Calculate therapeutic doses for a batch of patients with one condition
+        
+        Args:
+            condition: Medical condition shared by all patients in the batch
+            patient_batch: Patient parameters as equal-length 1-D arrays keyed like
+                the scalar patient parameters; missing keys take the scalar defaults
+            
+        Returns:
+            One GravitonDosimetry per patient, in batch order
+        """
+        batch_size = len(next(iter(patient_batch.values()))) if patient_batch else 0
+        logger.info(f"Calculating {batch_size} doses for {condition.value}")
         
-        return base_params.get(condition, {
-            'field_strength': 1e-9,
-            'base_duration': 30,
-            'frequency': None,
-            'gradient': 1e-12
-        })
+        base_parameters = cls._get_base_parameters(condition)
+        
+        field_strength = cls._adjust_for_patient_batch(base_parameters, patient_batch, batch_size)
+        safety_margin = cls._calculate_safety_margin_batch(field_strength, patient_batch, batch_size)
+        optimal_duration = cls._optimize_duration_batch(base_parameters['base_duration'],
+                                                         field_strength, condition)
+        total_dose = field_strength * optimal_duration
+        
+        frequency = base_parameters.get('frequency')
+        gradient = base_parameters.get('gradient')
+        
+        return [
+            GravitonDosimetry(
+                field_strength_tesla=strength,
+                exposure_duration_minutes=duration,
+                frequency_hz=frequency,
+                gradient_strength_t_m=gradient,
+                total_dose_t_min=dose,
+                safety_margin=margin
+            )
+            for strength, duration, dose, margin in zip(
+                field_strength.tolist(), optimal_duration.tolist(),
+                total_dose.tolist(), safety_margin.tolist()
+            )
+        ]
+    
+    @staticmethod
+    def _get_base_parameters(condition: MedicalCondition) -> MappingProxyType:
+        """Get base dosimetry parameters for medical condition"""
+        return _BASE_PARAMETERS[condition]
     
-    def _adjust_for_patient(self, base_params: Dict, patient_params: Dict) -> Dict:
+    @staticmethod
+    def _adjust_for_patient(base_params: Dict, patient_params: Dict) -> Dict:
         """Adjust dosimetry for patient-specific factors"""
         adjusted = base_params.copy()
         
@@ -210,7 +658,7 @@ class GravitonDosimetryCalculator:
         
         # Weight adjustment
         weight_kg = patient_params.get('weight_kg', 70)
-        weight_factor = np.sqrt(weight_kg / 70.0)  # Square root scaling
+        weight_factor = sqrt(weight_kg / 70.0)  # Square root scaling
         
         # Medical history adjustments
         sensitivity_factor = 1.0
@@ -226,12 +674,34 @@ class GravitonDosimetryCalculator:
         
         return adjusted
     
-    def _calculate_safety_margin(self, parameters: Dict, patient_params: Dict) -> float:
+    @staticmethod
+    def _adjust_for_patient_batch(base_params: Dict, patient_batch: Dict[str, np.ndarray],
+                                  batch_size: int) -> np.ndarray:
+        """Vectorized _adjust_for_patient returning adjusted field strengths"""
+        def column(key, default):
+            values = patient_batch.get(key)
+            return np.full(batch_size, default) if values is None else np.asarray(values)
+        
+        age = column('age_years', 40)
+        age_factor = np.where(age < 18, 0.6, np.where(age > 65, 0.8, 1.0))
+        
+        weight_factor = np.sqrt(column('weight_kg', 70) / 70.0)
+        
+        sensitivity_factor = (
+            np.where(column('previous_graviton_therapy', False), 1.2, 1.0) *
+            np.where(column('chronic_illness', False), 0.7, 1.0) *
+            np.where(column('implanted_devices', False), 0.5, 1.0)
+        )
+        
+        return base_params['field_strength'] * (age_factor * weight_factor * sensitivity_factor)
+    
+    @classmethod
+    def _calculate_safety_margin(cls, parameters: Dict, patient_params: Dict) -> float:
         """Calculate biological safety margin"""
         proposed_dose = parameters['field_strength']
         
         # Base safety threshold
-        base_threshold = self.safety_threshold
+        base_threshold = cls.safety_threshold
         
         # Patient-specific threshold adjustments
         if patient_params.get('high_risk', False):
@@ -244,44 +714,68 @@ class GravitonDosimetryCalculator:
         safety_margin = patient_threshold / proposed_dose
         return safety_margin
     
-    def _optimize_duration(self, parameters: Dict, condition: MedicalCondition) -> float:
+    @classmethod
+    def _calculate_safety_margin_batch(cls, field_strength: np.ndarray,
+                                       patient_batch: Dict[str, np.ndarray],
+                                       batch_size: int) -> np.ndarray:
+        """Vectorized _calculate_safety_margin"""
+        base_threshold = cls.safety_threshold
+        high_risk = patient_batch.get('high_risk', np.zeros(batch_size, dtype=bool))
+        sensitive = patient_batch.get('sensitive', np.zeros(batch_size, dtype=bool))
+        
+        patient_threshold = np.where(high_risk, base_threshold * 0.1,
+                                     np.where(sensitive, base_threshold * 0.5, base_threshold))
+        return patient_threshold / field_strength
+    
+    @classmethod
+    def _optimize_duration(cls, parameters: Dict, condition: MedicalCondition) -> float:
         """Optimize treatment duration for efficacy and safety"""
         base_duration = parameters['base_duration']
         field_strength = parameters['field_strength']
         
         # Efficacy considerations
-        if condition in [MedicalCondition.NEURAL_REGENERATION, MedicalCondition.WOUND_HEALING]:
-            duration_factor = 1.5  # Longer treatments for regenerative conditions
-        elif condition in [MedicalCondition.PAIN_MANAGEMENT]:
-            duration_factor = 0.5  # Shorter treatments for symptomatic relief
-        else:
-            duration_factor = 1.0
+        duration_factor = cls._duration_factor(condition)
         
         # Field strength adjustment (higher fields = shorter duration)
-        strength_factor = np.sqrt(1e-9 / field_strength)
+        strength_factor = sqrt(1e-9 / field_strength)
         
         optimal_duration = base_duration * duration_factor * strength_factor
         
         # Safety limits
-        max_duration = 120  # 2 hours maximum
-        min_duration = 5    # 5 minutes minimum
+        max_duration = 120.0  # 2 hours maximum
+        min_duration = 5.0    # 5 minutes minimum
         
-        return np.clip(optimal_duration, min_duration, max_duration)
+        return max(min_duration, min(optimal_duration, max_duration))
+    
+    @classmethod
+    def _optimize_duration_batch(cls, base_duration: float, field_strength: np.ndarray,
+                                 condition: MedicalCondition) -> np.ndarray:
+        """Vectorized _optimize_duration over adjusted field strengths"""
+        strength_factor = np.sqrt(1e-9 / field_strength)
+        optimal_duration = base_duration * cls._duration_factor(condition) * strength_factor
+        return np.clip(optimal_duration, 5, 120)
+    
+    @staticmethod
+    def _duration_factor(condition: MedicalCondition) -> float:
+        """Condition-specific treatment duration scaling"""
+        if condition in [MedicalCondition.NEURAL_REGENERATION, MedicalCondition.WOUND_HEALING]:
+            return 1.5  # Longer treatments for regenerative conditions
+        elif condition in [MedicalCondition.PAIN_MANAGEMENT]:
+            return 0.5  # Shorter treatments for symptomatic relief
+        return 1.0
 
 class TherapeuticProtocolDesigner:
     """Design comprehensive therapeutic protocols for specific conditions"""
     
+    # Treatment scheduling templates
+    schedule_templates = MappingProxyType({
+        'acute': MappingProxyType({'sessions_per_week': 5, 'total_weeks': 2}),
+        'chronic': MappingProxyType({'sessions_per_week': 3, 'total_weeks': 8}),
+        'maintenance': MappingProxyType({'sessions_per_week': 1, 'total_weeks': 12}),
+        'intensive': MappingProxyType({'sessions_per_week': 7, 'total_weeks': 1})
+    })
+    
     def __init__(self):
-        self.dosimetry_calculator = GravitonDosimetryCalculator()
-        
-        # Treatment scheduling templates
-        self.schedule_templates = {
-            'acute': {'sessions_per_week': 5, 'total_weeks': 2},
-            'chronic': {'sessions_per_week': 3, 'total_weeks': 8},
-            'maintenance': {'sessions_per_week': 1, 'total_weeks': 12},
-            'intensive': {'sessions_per_week': 7, 'total_weeks': 1}
-        }
-        
         logger.info("Therapeutic Protocol Designer initialized")
     
     def design_protocol(self, condition: MedicalCondition, modality: TreatmentModality,
@@ -290,7 +784,7 @@ class TherapeuticProtocolDesigner:
         logger.info(f"Designing protocol for {condition.value} using {modality.value}")
         
         # Calculate optimal dosimetry
-        dosimetry = self.dosimetry_calculator.calculate_therapeutic_dose(condition, patient_parameters)
+        dosimetry = GravitonDosimetryCalculator.calculate_therapeutic_dose(condition, patient_parameters)
         
         # Design treatment schedule
         schedule = self._design_treatment_schedule(condition, treatment_goal, dosimetry)
@@ -312,9 +806,9 @@ class TherapeuticProtocolDesigner:
             modality=modality,
             dosimetry=dosimetry,
             treatment_schedule=schedule,
-            contraindications=contraindications,
-            monitoring_requirements=monitoring,
-            efficacy_endpoints=endpoints,
+            contraindications=list(contraindications),
+            monitoring_requirements=list(monitoring),
+            efficacy_endpoints=list(endpoints),
             safety_protocols=safety_protocols
         )
         
@@ -334,24 +828,33 @@ class TherapeuticProtocolDesigner:
         else:
             template = self.schedule_templates['chronic']  # Default
         
+        # Session payloads are identical across the schedule, so build them once
+        # and share read-only views between every session record
+        dose_dict = MappingProxyType(dosimetry.to_dict())
+        pre_checks = self._get_pre_treatment_checks(condition)
+        post_monitoring = self._get_post_treatment_monitoring(condition)
+        
+        # Session day offsets: week-major, sessions spaced evenly within each week
+        day_offsets = (
+            7 * np.arange(template['total_weeks'])[:, np.newaxis] +
+            (7 // template['sessions_per_week']) * np.arange(template['sessions_per_week'])
+        ).ravel()
+        session_dates = np.datetime_as_string(
+            np.datetime64(datetime.now(), 'us') + day_offsets.astype('timedelta64[D]'),
+            unit='us'
+        )
+        
         # Generate session schedule
-        sessions = []
-        start_date = datetime.now()
-        
-        for week in range(template['total_weeks']):
-            for session in range(template['sessions_per_week']):
-                session_date = start_date + timedelta(
-                    weeks=week, 
-                    days=session * (7 // template['sessions_per_week'])
-                )
-                
-                sessions.append({
-                    'session_number': len(sessions) + 1,
-                    'date': session_date.isoformat(),
-                    'dosimetry': asdict(dosimetry),
-                    'pre_treatment_checks': self._get_pre_treatment_checks(condition),
-                    'post_treatment_monitoring': self._get_post_treatment_monitoring(condition)
-                })
+        sessions = [
+            {
+                'session_number': session_number,
+                'date': session_date,
+                'dosimetry': dose_dict,
+                'pre_treatment_checks': pre_checks,
+                'post_treatment_monitoring': post_monitoring
+            }
+            for session_number, session_date in enumerate(session_dates.tolist(), start=1)
+        ]
         
         return {
             'template_type': goal,
@@ -362,241 +865,232 @@ class TherapeuticProtocolDesigner:
             'rest_days_between_sessions': max(1, 7 // template['sessions_per_week'] - 1)
         }
     
-    def _define_contraindications(self, condition: MedicalCondition, 
-                                modality: TreatmentModality) -> List[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _define_contraindications(condition: MedicalCondition, 
+                                modality: TreatmentModality) -> Tuple[str, ...]:
         """Define contraindications for therapeutic protocol"""
-        general_contraindications = [
-            "Pregnancy",
-            "Active cancer (unless specifically approved)",
-            "Severe cardiac arrhythmias",
-            "Active bleeding disorders",
-            "Acute infectious disease",
-            "Severe psychiatric conditions"
-        ]
-        
-        condition_specific = {
-            MedicalCondition.CARDIOVASCULAR_DECONDITIONING: [
-                "Acute myocardial infarction (within 6 weeks)",
-                "Unstable angina",
-                "Severe heart failure (NYHA Class IV)",
-                "Uncontrolled hypertension (>180/110 mmHg)"
-            ],
-            MedicalCondition.NEURAL_REGENERATION: [
-                "Active seizure disorder",
-                "Brain tumor",
-                "Recent stroke (within 3 months)",
-                "Implanted neural devices without compatibility testing"
-            ],
-            MedicalCondition.BONE_DENSITY_LOSS: [
-                "Recent fracture at treatment site",
-                "Active bone infection",
-                "Bone metastases",
-                "Severe osteomalacia"
-            ]
-        }
-        
-        modality_specific = {
-            TreatmentModality.PULSED_THERAPY: [
-                "Epilepsy or seizure history",
-                "Cochlear implants"
-            ],
-            TreatmentModality.GRADIENT_THERAPY: [
-                "Metallic implants in treatment field",
-                "Pacemaker or ICD (without compatibility verification)"
-            ]
-        }
-        
-        all_contraindications = general_contraindications.copy()
-        all_contraindications.extend(condition_specific.get(condition, []))
-        all_contraindications.extend(modality_specific.get(modality, []))
-        
-        return all_contraindications
+        return (*_GENERAL_CONTRAINDICATIONS,
+                *_CONDITION_CONTRAINDICATIONS[condition],
+                *_MODALITY_CONTRAINDICATIONS[modality])
     
     def _define_monitoring_requirements(self, condition: MedicalCondition,
                                       modality: TreatmentModality,
-                                      dosimetry: GravitonDosimetry) -> List[str]:
+                                      dosimetry: GravitonDosimetry) -> Tuple[str, ...]:
         """Define monitoring requirements during therapy"""
-        baseline_monitoring = [
-            "Vital signs (HR, BP, RR, SpO2) before, during, and after treatment",
-            "Patient comfort and subjective response assessment",
-            "Real-time graviton field strength monitoring",
-            "Emergency stop system verification",
-            "Adverse event documentation"
-        ]
-        
-        condition_monitoring = {
-            MedicalCondition.CARDIOVASCULAR_DECONDITIONING: [
-                "Continuous ECG monitoring during treatment",
-                "Blood pressure monitoring every 10 minutes",
-                "Exercise tolerance testing pre/post treatment"
+        return self._monitoring_requirements_for(condition, dosimetry._enhanced_monitoring)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _monitoring_requirements_for(condition: MedicalCondition,
+                                     enhanced_monitoring: bool) -> Tuple[str, ...]:
+        """Monitoring requirements keyed on condition and enhanced-monitoring need"""
+        return (*_BASELINE_MONITORING,
+                *_CONDITION_MONITORING[condition],
+                *(_ENHANCED_MONITORING if enhanced_monitoring else ()))
+    
+    @staticmethod
+    def _define_efficacy_endpoints(condition: MedicalCondition) -> Tuple[str, ...]:
+        """Define efficacy endpoints for outcome measurement"""
+        return _EFFICACY_ENDPOINTS[condition]
+    
+    def _create_safety_protocols(self, condition: MedicalCondition,
+                               dosimetry: GravitonDosimetry) -> MappingProxyType:
+        """Create comprehensive safety protocols"""
+        return _SAFETY_TEMPLATE
+    
+    @staticmethod
+    def _get_pre_treatment_checks(condition: MedicalCondition) -> Tuple[str, ...]:
+        """Get pre-treatment safety checks"""
+        return _PRE_TREATMENT_CHECKS
+    
+    @staticmethod
+    def _get_post_treatment_monitoring(condition: MedicalCondition) -> Tuple[str, ...]:
+        """Get post-treatment monitoring requirements"""
+        return _POST_TREATMENT_MONITORING
+
+@functools.lru_cache(maxsize=1)
+def _process_designer() -> 'TherapeuticProtocolDesigner':
+    """Protocol designer shared by every task run in this process"""
+    return TherapeuticProtocolDesigner()
+
+def _design_one(condition: MedicalCondition, modality: TreatmentModality, goal: str,
+                patient_parameters: Dict) -> Optional[TherapeuticProtocol]:
+    """Design a single library protocol; module-level so worker processes can run it"""
+    try:
+        return _process_designer().design_protocol(
+            condition=condition,
+            modality=modality,
+            patient_parameters=patient_parameters,
+            treatment_goal=goal
+        )
+    except Exception as e:
+        logger.warning(f"Failed to develop {modality.value}_{goal} for {condition.value}: {e}")
+        return None
+
+def _validation_bits(protocol: TherapeuticProtocol) -> int:
+    """Validation bitmask of one protocol; module-level so worker processes can run it"""
+    return protocol.validation_bits()
+
+def _freeze(obj):
+    """Recursively convert dicts and lists to read-only mappings and tuples of interned strings"""
+    if isinstance(obj, dict):
+        return MappingProxyType({sys.intern(key): _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    return obj
+
+@functools.lru_cache(maxsize=1)
+def _implementation_guidelines() -> MappingProxyType:
+    """Implementation guidelines for clinical deployment, built once"""
+    return _freeze({
+        'facility_requirements': {
+            'equipment_specifications': [
+                'Medical-grade graviton field generator',
+                'Real-time field monitoring system',
+                'Emergency stop capabilities',
+                'Patient monitoring equipment',
+                'Data logging and analysis system'
+            ],
+            'facility_design': [
+                'Shielded treatment room',
+                'Emergency medical equipment access',
+                'Patient comfort amenities',
+                'Staff observation area',
+                'Equipment maintenance space'
             ],
-            MedicalCondition.NEURAL_REGENERATION: [
-                "Neurological examination before and after each session",
-                "EEG monitoring during treatment (if indicated)",
-                "Cognitive function assessment"
+            'safety_systems': [
+                'Redundant emergency stop systems',
+                'Automatic field monitoring',
+                'Patient alarm systems',
+                'Environmental monitoring',
+                'Emergency medical response'
+            ]
+        },
+        'staff_requirements': {
+            'minimum_staffing': [
+                'Certified graviton therapy technician',
+                'Licensed physician (on-call minimum)',
+                'Registered nurse',
+                'Medical physicist (for complex cases)'
             ],
-            MedicalCondition.BONE_DENSITY_LOSS: [
-                "Pain scale assessment",
-                "Range of motion measurement",
-                "Bone density scans (monthly)"
+            'training_requirements': [
+                'Graviton therapy certification (40 hours)',
+                'Emergency response training',
+                'Patient safety protocols',
+                'Equipment operation and maintenance',
+                'Clinical documentation requirements'
             ],
-            MedicalCondition.WOUND_HEALING: [
-                "Wound measurement and photography",
-                "Infection signs assessment",
-                "Tissue perfusion monitoring"
+            'continuing_education': [
+                'Annual recertification required',
+                'Monthly safety updates',
+                'Quarterly protocol reviews',
+                'Participation in outcomes research'
             ]
-        }
-        
-        safety_level_monitoring = []
-        if dosimetry.safety_margin < 1e12:
-            safety_level_monitoring.extend([
-                "Enhanced continuous monitoring",
-                "Laboratory safety biomarkers",
-                "Physician presence required"
-            ])
-        
-        all_monitoring = baseline_monitoring.copy()
-        all_monitoring.extend(condition_monitoring.get(condition, []))
-        all_monitoring.extend(safety_level_monitoring)
-        
-        return all_monitoring
-    
-    def _define_efficacy_endpoints(self, condition: MedicalCondition) -> List[str]:
-        """Define efficacy endpoints for outcome measurement"""
-        endpoints = {
-            MedicalCondition.BONE_DENSITY_LOSS: [
-                "Bone mineral density increase (DEXA scan)",
-                "Reduced fracture risk score",
-                "Improved trabecular bone score",
-                "Decreased bone turnover markers"
+        },
+        'patient_selection': {
+            'inclusion_criteria': [
+                'Appropriate medical indication',
+                'Informed consent obtained',
+                'Medical clearance completed',
+                'Contraindication screening passed'
             ],
-            MedicalCondition.MUSCLE_ATROPHY: [
-                "Increased muscle mass (MRI or DEXA)",
-                "Improved muscle strength (dynamometry)",
-                "Enhanced functional capacity",
-                "Reduced muscle fatigue"
+            'screening_requirements': [
+                'Complete medical history',
+                'Physical examination',
+                'Baseline laboratory tests',
+                'Imaging studies if indicated',
+                'Psychiatric evaluation if indicated'
+            ]
+        },
+        'quality_management': {
+            'outcome_tracking': [
+                'Treatment efficacy measures',
+                'Adverse event monitoring',
+                'Patient satisfaction surveys',
+                'Long-term follow-up',
+                'Protocol adherence metrics'
             ],
-            MedicalCondition.CARDIOVASCULAR_DECONDITIONING: [
-                "Improved exercise tolerance (VO2 max)",
-                "Enhanced cardiac output",
-                "Reduced resting heart rate",
-                "Improved vascular compliance"
+            'continuous_improvement': [
+                'Regular protocol reviews',
+                'Outcome data analysis',
+                'Best practice sharing',
+                'Research participation',
+                'Technology updates'
+            ]
+        }
+    })
+
+@functools.lru_cache(maxsize=1)
+def _clinical_trial_framework() -> MappingProxyType:
+    """Clinical trial framework for regulatory approval, built once"""
+    return _freeze({
+        'phase_1_trials': {
+            'objective': 'Safety and dosimetry determination',
+            'population': 'Small cohorts (10-20 patients)',
+            'duration': '3-6 months',
+            'primary_endpoints': [
+                'Maximum tolerated dose determination',
+                'Dose-limiting toxicity identification',
+                'Safety profile characterization',
+                'Optimal dosimetry parameters'
             ],
-            MedicalCondition.WOUND_HEALING: [
-                "Accelerated wound closure rate",
-                "Improved tissue granulation",
-                "Reduced inflammation markers",
-                "Enhanced angiogenesis"
+            'regulatory_requirements': [
+                'IND application approved',
+                'IRB approval obtained',
+                'Informed consent developed',
+                'Safety monitoring plan',
+                'Data safety monitoring board'
+            ]
+        },
+        'phase_2_trials': {
+            'objective': 'Efficacy determination and dose optimization',
+            'population': 'Medium cohorts (50-100 patients)',
+            'duration': '6-12 months',
+            'primary_endpoints': [
+                'Clinical efficacy demonstration',
+                'Dose-response relationships',
+                'Optimal treatment protocols',
+                'Patient selection criteria'
             ],
-            MedicalCondition.PAIN_MANAGEMENT: [
-                "Reduced pain scores (VAS/NRS)",
-                "Decreased analgesic requirements",
-                "Improved quality of life scores",
-                "Enhanced sleep quality"
+            'study_designs': [
+                'Randomized controlled trials',
+                'Dose-escalation studies',
+                'Comparator studies',
+                'Biomarker validation'
+            ]
+        },
+        'phase_3_trials': {
+            'objective': 'Definitive efficacy and safety demonstration',
+            'population': 'Large cohorts (200-1000 patients)',
+            'duration': '1-3 years',
+            'primary_endpoints': [
+                'Superior or non-inferior efficacy',
+                'Comprehensive safety profile',
+                'Quality of life improvements',
+                'Long-term outcomes'
             ],
-            MedicalCondition.NEURAL_REGENERATION: [
-                "Improved neurological function scores",
-                "Enhanced nerve conduction velocity",
-                "Increased brain-derived neurotrophic factor",
-                "Improved cognitive assessment scores"
+            'regulatory_pathway': [
+                'FDA Pre-Submission meeting',
+                'Protocol assistance request',
+                'Special protocol assessment',
+                'BLA/NDA preparation',
+                'Advisory committee preparation'
+            ]
+        },
+        'post_market_surveillance': {
+            'objective': 'Long-term safety and effectiveness monitoring',
+            'requirements': [
+                'Adverse event reporting',
+                'Periodic safety updates',
+                'Risk evaluation mitigation',
+                'Long-term registry studies',
+                'Real-world evidence generation'
             ]
         }
-        
-        return endpoints.get(condition, [
-            "Clinical improvement in target condition",
-            "Improved quality of life measures",
-            "Reduced symptom severity"
-        ])
-    
-    def _create_safety_protocols(self, condition: MedicalCondition,
-                               dosimetry: GravitonDosimetry) -> Dict:
-        """Create comprehensive safety protocols"""
-        return {
-            'emergency_stop': {
-                'automatic_triggers': [
-                    'Field strength exceeds 110% of prescribed dose',
-                    'Patient vital signs outside normal ranges',
-                    'Equipment malfunction detected',
-                    'Patient reports severe discomfort'
-                ],
-                'manual_triggers': [
-                    'Patient request',
-                    'Clinician observation of adverse effects',
-                    'Emergency medical situation'
-                ],
-                'response_time': '<1 second automatic, <5 seconds manual',
-                'post_stop_procedures': [
-                    'Immediate patient assessment',
-                    'Vital signs monitoring',
-                    'Incident documentation',
-                    'Medical evaluation if indicated'
-                ]
-            },
-            'adverse_event': {
-                'classification': [
-                    'Mild: No intervention required',
-                    'Moderate: Medical evaluation needed',
-                    'Severe: Immediate medical intervention',
-                    'Life-threatening: Emergency response'
-                ],
-                'reporting_timeline': {
-                    'mild': '24 hours',
-                    'moderate': '4 hours', 
-                    'severe': '1 hour',
-                    'life_threatening': 'Immediate'
-                },
-                'documentation_requirements': [
-                    'Detailed event description',
-                    'Treatment parameters at time of event',
-                    'Patient response and interventions',
-                    'Outcome and follow-up plan'
-                ]
-            },
-            'monitoring': {
-                'frequency': 'Continuous during treatment',
-                'parameters': [
-                    'Graviton field strength and uniformity',
-                    'Patient vital signs',
-                    'Subjective symptom reports',
-                    'Environmental conditions'
-                ],
-                'alarm_limits': {
-                    'field_strength_variance': '±5%',
-                    'heart_rate': 'Age-appropriate ±20%',
-                    'blood_pressure': '±20% from baseline',
-                    'oxygen_saturation': '>95%'
-                },
-                'data_logging': 'All parameters recorded every 10 seconds'
-            },
-            'quality_assurance': {
-                'equipment_calibration': 'Daily before first use',
-                'staff_training': 'Annual certification required',
-                'protocol_adherence': 'Real-time compliance monitoring',
-                'outcome_tracking': 'Comprehensive database maintenance'
-            }
-        }
-    
-    def _get_pre_treatment_checks(self, condition: MedicalCondition) -> List[str]:
-        """Get pre-treatment safety checks"""
-        return [
-            "Patient identity verification",
-            "Informed consent confirmation",
-            "Contraindication screening",
-            "Baseline vital signs",
-            "Equipment calibration verification",
-            "Emergency equipment check"
-        ]
-    
-    def _get_post_treatment_monitoring(self, condition: MedicalCondition) -> List[str]:
-        """Get post-treatment monitoring requirements"""
-        return [
-            "Immediate post-treatment vital signs",
-            "Symptom assessment",
-            "Adverse event screening",
-            "Treatment response documentation",
-            "Next session scheduling",
-            "Patient education reinforcement"
-        ]
+    })
 
 class AdvancedTherapeuticProtocolFramework:
     """Complete framework for advanced therapeutic protocol development"""
@@ -607,68 +1101,153 @@ class AdvancedTherapeuticProtocolFramework:
         
         logger.info("Advanced Therapeutic Protocol Framework initialized")
     
-    def develop_comprehensive_protocols(self) -> Dict:
-        """Develop comprehensive protocols for all major conditions"""
-        logger.info("=== Developing Comprehensive Therapeutic Protocols ===")
-        
-        # Standard patient parameters for protocol development
-        standard_patient = {
-            'age_years': 45,
-            'weight_kg': 70,
-            'height_cm': 170,
-            'previous_graviton_therapy': False,
-            'chronic_illness': False,
-            'implanted_devices': False,
-            'high_risk': False,
-            'sensitive': False
-        }
+    # Standard patient parameters for protocol development
+    standard_patient = MappingProxyType({
+        'age_years': 45,
+        'weight_kg': 70,
+        'height_cm': 170,
+        'previous_graviton_therapy': False,
+        'chronic_illness': False,
+        'implanted_devices': False,
+        'high_risk': False,
+        'sensitive': False
+    })
+    
+    # Modalities and treatment goals covered by the protocol library
+    library_modalities = (TreatmentModality.LOCALIZED_FIELD,
+                          TreatmentModality.SYSTEMIC_FIELD,
+                          TreatmentModality.PULSED_THERAPY)
+    library_goals = ('acute_treatment', 'chronic_management', 'maintenance')
+    
+    @property
+    def implementation_guidelines(self) -> MappingProxyType:
+        """Implementation guidelines for clinical deployment"""
+        return _implementation_guidelines()
+    
+    @property
+    def clinical_trial_framework(self) -> MappingProxyType:
+        """Clinical trial framework for regulatory approval"""
+        return _clinical_trial_framework()
+    
+    def iter_protocols(self, max_workers: Optional[int] = None
+                       ) -> Iterator[Tuple[MedicalCondition, TreatmentModality, str, TherapeuticProtocol]]:
+        """
+        Yield (condition, modality, goal, protocol) for every library protocol
         
-        protocols_developed = {}
+        Args:
+            max_workers: Design protocols in this many worker processes;
+                None designs them serially in the current process
+        """
+        if max_workers is not None:
+            yield from self._iter_protocols_parallel(max_workers)
+            return
         
         # Develop protocols for each major condition
         for condition in MedicalCondition:
             logger.info(f"Developing protocols for {condition.value}")
             
-            condition_protocols = {}
-            
-            # Develop protocols for different modalities
-            for modality in [TreatmentModality.LOCALIZED_FIELD, 
-                           TreatmentModality.SYSTEMIC_FIELD,
-                           TreatmentModality.PULSED_THERAPY]:
-                
-                # Develop protocols for different treatment goals
-                for goal in ['acute_treatment', 'chronic_management', 'maintenance']:
-                    protocol_key = f"{modality.value}_{goal}"
-                    
+            # Develop protocols for different modalities and treatment goals
+            for modality in self.library_modalities:
+                for goal in self.library_goals:
                     try:
                         protocol = self.protocol_designer.design_protocol(
                             condition=condition,
                             modality=modality,
-                            patient_parameters=standard_patient,
+                            patient_parameters=self.standard_patient,
                             treatment_goal=goal
                         )
-                        
-                        condition_protocols[protocol_key] = protocol
-                        
                     except Exception as e:
-                        logger.warning(f"Failed to develop {protocol_key} for {condition.value}: {e}")
-            
-            protocols_developed[condition.value] = condition_protocols
+                        logger.warning(f"Failed to develop {modality.value}_{goal} for {condition.value}: {e}")
+                        continue
+                    
+                    yield condition, modality, goal, protocol
+    
+    def _iter_protocols_parallel(self, max_workers: int
+                                 ) -> Iterator[Tuple[MedicalCondition, TreatmentModality, str, TherapeuticProtocol]]:
+        """Design every library protocol across a process pool, preserving library order"""
+        tasks = [(condition, modality, goal)
+                 for condition in MedicalCondition
+                 for modality in self.library_modalities
+                 for goal in self.library_goals]
+        conditions, modalities, goals = zip(*tasks)
+        patients = [dict(self.standard_patient)] * len(tasks)
         
-        # Validate all protocols
-        validation_results = self._validate_protocol_library(protocols_developed)
+        logger.info(f"Developing {len(tasks)} protocols across {max_workers} worker processes")
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_design_one, conditions, modalities, goals, patients, chunksize=8)
+            for (condition, modality, goal), protocol in zip(tasks, results):
+                if protocol is not None:
+                    yield condition, modality, goal, protocol
+    
+    def to_jsonl(self, path: Union[str, Path], max_workers: Optional[int] = None) -> Dict:
+        """
+        Stream the protocol library to a JSON Lines file, one protocol per line
+        
+        Protocols are written as they are designed so peak memory stays at a
+        single protocol; only scalar validation counters are accumulated.
+        
+        Args:
+            path: Output file
+            max_workers: Worker processes passed through to iter_protocols
+        
+        Returns:
+            Summary of the streamed library
+        """
+        total_protocols = 0
+        protocols_passed = 0
+        score_total = 0.0
         
-        # Generate implementation guidelines
-        implementation_guidelines = self._generate_implementation_guidelines()
+        with open(path, 'wb') as f:
+            for condition, modality, goal, protocol in self.iter_protocols(max_workers):
+                validation_score = protocol.validation_score()
+                
+                record = {
+                    'condition': condition.value,
+                    'protocol': f"{modality.value}_{goal}",
+                    'validation_score': validation_score,
+                    'therapeutic_protocol': protocol.to_dict()
+                }
+                f.write(_dumps(record))
+                f.write(b'\n')
+                
+                total_protocols += 1
+                score_total += validation_score
+                if validation_score >= 0.8:
+                    protocols_passed += 1
         
-        # Create clinical trial framework
-        clinical_trial_framework = self._create_clinical_trial_framework()
+        overall_score = score_total / total_protocols if total_protocols else 0.0
+        logger.info(f"Streamed {total_protocols} protocols to {path}")
+        
+        return {
+            'total_protocols': total_protocols,
+            'protocols_passed': protocols_passed,
+            'overall_validation_score': overall_score,
+            'implementation_ready': overall_score >= 0.8
+        }
+    
+    def develop_comprehensive_protocols(self, max_workers: Optional[int] = None) -> Dict:
+        """
+        Develop comprehensive protocols for all major conditions
+        
+        Args:
+            max_workers: Design protocols in this many worker processes;
+                None (default) designs them serially
+        """
+        logger.info("=== Developing Comprehensive Therapeutic Protocols ===")
+        
+        protocols_developed = {condition.value: {} for condition in MedicalCondition}
+        for condition, modality, goal, protocol in self.iter_protocols(max_workers):
+            protocols_developed[condition.value][f"{modality.value}_{goal}"] = protocol
+        
+        # Validate all protocols
+        validation_results = self._validate_protocol_library(protocols_developed, max_workers)
         
         comprehensive_framework = {
             'therapeutic_protocols': protocols_developed,
             'validation_results': validation_results,
-            'implementation_guidelines': implementation_guidelines,
-            'clinical_trial_framework': clinical_trial_framework,
+            'implementation_guidelines': self.implementation_guidelines,
+            'clinical_trial_framework': self.clinical_trial_framework,
             'development_summary': {
                 'total_conditions': len(MedicalCondition),
                 'total_protocols': sum(len(protocols) for protocols in protocols_developed.values()),
@@ -686,187 +1265,62 @@ class AdvancedTherapeuticProtocolFramework:
         
         return comprehensive_framework
     
-    def _validate_protocol_library(self, protocols: Dict) -> Dict:
-        """Validate entire protocol library"""
+    def _validate_protocol_library(self, protocols: Dict, max_workers: Optional[int] = None) -> Dict:
+        """
+        Validate entire protocol library
+        
+        Args:
+            protocols: Protocols keyed by condition and protocol name
+            max_workers: Compute validation bitmasks in this many worker
+                processes; None validates serially
+        """
         logger.info("Validating protocol library...")
         
-        validation_results = []
-        protocols_passed = 0
+        entries = [
+            (condition, protocol_key, protocol)
+            for condition, condition_protocols in protocols.items()
+            for protocol_key, protocol in condition_protocols.items()
+        ]
+        total_protocols = len(entries)
         
-        for condition, condition_protocols in protocols.items():
-            for protocol_key, protocol in condition_protocols.items():
-                validation = protocol.validate_protocol()
-                validation_score = sum(validation.values()) / len(validation)
-                
-                validation_results.append({
-                    'condition': condition,
-                    'protocol': protocol_key,
-                    'validation_score': validation_score,
-                    'passed': validation_score >= 0.8,
-                    'details': validation
-                })
-                
-                if validation_score >= 0.8:
-                    protocols_passed += 1
+        # Map: one validation bitmask per protocol, streamed straight into the array
+        if max_workers is not None and total_protocols:
+            chunksize = max(1, total_protocols // (4 * max_workers))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                bits = np.fromiter(executor.map(_validation_bits,
+                                                [protocol for _, _, protocol in entries],
+                                                chunksize=chunksize),
+                                   dtype=np.uint8, count=total_protocols)
+        else:
+            bits = np.fromiter((protocol.validation_bits() for _, _, protocol in entries),
+                               dtype=np.uint8, count=total_protocols)
         
-        overall_score = np.mean([r['validation_score'] for r in validation_results])
+        # Reduce: protocols x criteria pass matrix, reduced along the criteria axis
+        criteria = (bits[:, np.newaxis] & _CRITERIA_FLAGS) != 0
+        scores, passed, protocols_passed = _aggregate_scores(criteria)
+        
+        validation_results = [
+            {
+                'condition': condition,
+                'protocol': protocol_key,
+                'validation_score': validation_score,
+                'passed': protocol_passed,
+                'details': dict(zip(_CRITERIA_NAMES, row))
+            }
+            for (condition, protocol_key, _), validation_score, protocol_passed, row in zip(
+                entries, scores.tolist(), passed.tolist(), criteria.tolist())
+        ]
+        
+        overall_score = float(scores.mean()) if total_protocols else 0.0
         
         return {
             'individual_validations': validation_results,
             'overall_validation_score': overall_score,
             'protocols_passed': protocols_passed,
-            'total_protocols': len(validation_results),
-            'pass_rate': protocols_passed / len(validation_results) if validation_results else 0,
+            'total_protocols': total_protocols,
+            'pass_rate': protocols_passed / total_protocols if total_protocols else 0,
             'implementation_ready': overall_score >= 0.8
         }
-    
-    def _generate_implementation_guidelines(self) -> Dict:
-        """Generate implementation guidelines for clinical deployment"""
-        return {
-            'facility_requirements': {
-                'equipment_specifications': [
-                    'Medical-grade graviton field generator',
-                    'Real-time field monitoring system',
-                    'Emergency stop capabilities',
-                    'Patient monitoring equipment',
-                    'Data logging and analysis system'
-                ],
-                'facility_design': [
-                    'Shielded treatment room',
-                    'Emergency medical equipment access',
-                    'Patient comfort amenities',
-                    'Staff observation area',
-                    'Equipment maintenance space'
-                ],
-                'safety_systems': [
-                    'Redundant emergency stop systems',
-                    'Automatic field monitoring',
-                    'Patient alarm systems',
-                    'Environmental monitoring',
-                    'Emergency medical response'
-                ]
-            },
-            'staff_requirements': {
-                'minimum_staffing': [
-                    'Certified graviton therapy technician',
-                    'Licensed physician (on-call minimum)',
-                    'Registered nurse',
-                    'Medical physicist (for complex cases)'
-                ],
-                'training_requirements': [
-                    'Graviton therapy certification (40 hours)',
-                    'Emergency response training',
-                    'Patient safety protocols',
-                    'Equipment operation and maintenance',
-                    'Clinical documentation requirements'
-                ],
-                'continuing_education': [
-                    'Annual recertification required',
-                    'Monthly safety updates',
-                    'Quarterly protocol reviews',
-                    'Participation in outcomes research'
-                ]
-            },
-            'patient_selection': {
-                'inclusion_criteria': [
-                    'Appropriate medical indication',
-                    'Informed consent obtained',
-                    'Medical clearance completed',
-                    'Contraindication screening passed'
-                ],
-                'screening_requirements': [
-                    'Complete medical history',
-                    'Physical examination',
-                    'Baseline laboratory tests',
-                    'Imaging studies if indicated',
-                    'Psychiatric evaluation if indicated'
-                ]
-            },
-            'quality_management': {
-                'outcome_tracking': [
-                    'Treatment efficacy measures',
-                    'Adverse event monitoring',
-                    'Patient satisfaction surveys',
-                    'Long-term follow-up',
-                    'Protocol adherence metrics'
-                ],
-                'continuous_improvement': [
-                    'Regular protocol reviews',
-                    'Outcome data analysis',
-                    'Best practice sharing',
-                    'Research participation',
-                    'Technology updates'
-                ]
-            }
-        }
-    
-    def _create_clinical_trial_framework(self) -> Dict:
-        """Create framework for clinical trials of graviton therapies"""
-        return {
-            'phase_1_trials': {
-                'objective': 'Safety and dosimetry determination',
-                'population': 'Small cohorts (10-20 patients)',
-                'duration': '3-6 months',
-                'primary_endpoints': [
-                    'Maximum tolerated dose determination',
-                    'Dose-limiting toxicity identification',
-                    'Safety profile characterization',
-                    'Optimal dosimetry parameters'
-                ],
-                'regulatory_requirements': [
-                    'IND application approved',
-                    'IRB approval obtained',
-                    'Informed consent developed',
-                    'Safety monitoring plan',
-                    'Data safety monitoring board'
-                ]
-            },
-            'phase_2_trials': {
-                'objective': 'Efficacy determination and dose optimization',
-                'population': 'Medium cohorts (50-100 patients)',
-                'duration': '6-12 months',
-                'primary_endpoints': [
-                    'Clinical efficacy demonstration',
-                    'Dose-response relationships',
-                    'Optimal treatment protocols',
-                    'Patient selection criteria'
-                ],
-                'study_designs': [
-                    'Randomized controlled trials',
-                    'Dose-escalation studies',
-                    'Comparator studies',
-                    'Biomarker validation'
-                ]
-            },
-            'phase_3_trials': {
-                'objective': 'Definitive efficacy and safety demonstration',
-                'population': 'Large cohorts (200-1000 patients)',
-                'duration': '1-3 years',
-                'primary_endpoints': [
-                    'Superior or non-inferior efficacy',
-                    'Comprehensive safety profile',
-                    'Quality of life improvements',
-                    'Long-term outcomes'
-                ],
-                'regulatory_pathway': [
-                    'FDA Pre-Submission meeting',
-                    'Protocol assistance request',
-                    'Special protocol assessment',
-                    'BLA/NDA preparation',
-                    'Advisory committee preparation'
-                ]
-            },
-            'post_market_surveillance': {
-                'objective': 'Long-term safety and effectiveness monitoring',
-                'requirements': [
-                    'Adverse event reporting',
-                    'Periodic safety updates',
-                    'Risk evaluation mitigation',
-                    'Long-term registry studies',
-                    'Real-world evidence generation'
-                ]
-            }
-        }
 
 def main():
     """Demonstrate advanced therapeutic protocol framework"""
@@ -879,8 +1333,8 @@ def main():
     comprehensive_protocols = framework.develop_comprehensive_protocols()
     
     # Save results
-    with open('advanced_therapeutic_protocols.json', 'w') as f:
-        json.dump(comprehensive_protocols, f, indent=2, default=str)
+    Path('advanced_therapeutic_protocols.json').write_bytes(
+        dumps_framework(comprehensive_protocols, indent=True))
     
     # Print summary
     logger.info("\n=== Protocol Development Summary ===")
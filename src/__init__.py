@@ -12,37 +12,49 @@ Key Features:
 - Medical-grade graviton field protocols with tissue-specific safety
 """
 
-# Import legacy components for backward compatibility
-try:
-    from .array import MedicalTractorArray, MedicalArrayParams, TractorBeam, BeamMode, SafetyLevel, VitalSigns
-except ImportError:
-    # Legacy imports not available
-    pass
+import importlib
 
-# Import revolutionary LQG-enhanced components
-from .array import (
-    LQGMedicalTractorArray,
-    BiologicalTargetType,
-    MedicalTarget,
-    MedicalProcedureMode,
-    BiologicalSafetyProtocols,
-    LQGMedicalMetrics
-)
+# Submodule providing each public name; heavy submodules load on first access (PEP 562)
+_LAZY_IMPORTS = {
+    # Revolutionary LQG-enhanced components
+    "LQGMedicalTractorArray": ".array",
+    "BiologicalTargetType": ".array",
+    "MedicalTarget": ".array",
+    "MedicalProcedureMode": ".array",
+    "BiologicalSafetyProtocols": ".array",
+    "LQGMedicalMetrics": ".array",
+    
+    # UQ resolution framework
+    "MedicalTractorArrayUQResolver": ".uq_resolution_framework",
+    "UQResolutionMetrics": ".uq_resolution_framework",
+    
+    # Revolutionary graviton safety controller
+    "MedicalGravitonSafetyController": ".graviton_safety_controller",
+    "GravitonFieldMode": ".graviton_safety_controller",
+    "BiologicalSafetyLevel": ".graviton_safety_controller",
+    "GravitonSafetyConstraints": ".graviton_safety_controller",
+    "GravitonFieldMetrics": ".graviton_safety_controller",
+    
+    # Legacy components for backward compatibility (if available)
+    "MedicalTractorArray": ".array",
+    "MedicalArrayParams": ".array",
+    "TractorBeam": ".array",
+    "BeamMode": ".array",
+    "SafetyLevel": ".array",
+    "VitalSigns": ".array"
+}
 
-# Import UQ resolution framework
-from .uq_resolution_framework import (
-    MedicalTractorArrayUQResolver,
-    UQResolutionMetrics
-)
+def __getattr__(name):
+    """Load public names from their submodule on first access"""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Import revolutionary graviton safety controller
-from .graviton_safety_controller import (
-    MedicalGravitonSafetyController,
-    GravitonFieldMode,
-    BiologicalSafetyLevel, 
-    GravitonSafetyConstraints,
-    GravitonFieldMetrics
-)
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     # Revolutionary LQG-enhanced components
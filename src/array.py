@@ -19,6 +19,7 @@ Revolutionary Safety Features:
 - Real-time safety monitoring with T_μν ≥ 0 enforcement
 """
 
+import math
 import numpy as np
 import scipy.integrate as integrate
 import scipy.optimize as optimize
@@ -75,6 +76,72 @@ class BiologicalSafetyProtocols:
     biological_protection_margin: float = 1e12  # 10^12 safety factor
     causality_protection_active: bool = True    # CTC prevention
     
+def _norm3(v: np.ndarray) -> float:
+    """Euclidean norm of a 3-vector without np.linalg.norm dispatch overhead"""
+    x, y, z = v.tolist()
+    return math.sqrt(x * x + y * y + z * z)
+
+# Revolutionary tissue-specific safety protocols
+_TISSUE_PROTOCOLS = {
+    BiologicalTargetType.NEURAL_TISSUE: {
+        'max_force': 1e-15,        # 0.001 pN for neural safety
+        'max_acceleration': 1e-6,   # Extremely gentle acceleration
+        'safety_factor': 1000.0,    # Ultra-high safety margin
+        'monitoring_frequency': 20000,  # 20 kHz for neural monitoring
+        'emergency_threshold': 1e-16    # Hair-trigger emergency response
+    },
+    BiologicalTargetType.BLOOD_VESSEL: {
+        'max_force': 1e-14,        # 0.01 pN for vascular safety
+        'max_acceleration': 1e-5,   # Gentle vascular manipulation
+        'safety_factor': 500.0,     # High safety margin
+        'monitoring_frequency': 15000,  # 15 kHz monitoring
+        'emergency_threshold': 1e-15
+    },
+    BiologicalTargetType.CELL: {
+        'max_force': 1e-13,        # 0.1 pN for cellular manipulation
+        'max_acceleration': 1e-4,   # Cellular-safe acceleration
+        'safety_factor': 100.0,     # Standard safety margin
+        'monitoring_frequency': 10000,  # 10 kHz monitoring
+        'emergency_threshold': 1e-14
+    },
+    BiologicalTargetType.TISSUE: {
+        'max_force': 1e-12,        # 1 pN for tissue manipulation
+        'max_acceleration': 1e-3,   # Tissue-safe acceleration
+        'safety_factor': 50.0,      # Moderate safety margin
+        'monitoring_frequency': 5000,   # 5 kHz monitoring
+        'emergency_threshold': 1e-13
+    },
+    BiologicalTargetType.ORGAN: {
+        'max_force': 1e-11,        # 10 pN for organ manipulation
+        'max_acceleration': 1e-2,   # Organ-level acceleration
+        'safety_factor': 25.0,      # Reduced safety margin
+        'monitoring_frequency': 2000,   # 2 kHz monitoring
+        'emergency_threshold': 1e-12
+    },
+    BiologicalTargetType.SURGICAL_TOOL: {
+        'max_force': 1e-9,         # 1 nN for surgical tools
+        'max_acceleration': 0.1,    # Tool manipulation acceleration
+        'safety_factor': 5.0,       # Minimal safety margin
+        'monitoring_frequency': 1000,   # 1 kHz monitoring
+        'emergency_threshold': 1e-10
+    }
+}
+
+# Per-tissue limits as arrays indexed by BiologicalTargetType declaration order
+_TISSUE_INDEX = {tissue_type: index for index, tissue_type in enumerate(BiologicalTargetType)}
+_DEFAULT_TISSUE_INDEX = _TISSUE_INDEX[BiologicalTargetType.TISSUE]  # Unrecognised types get tissue limits
+_PROTOCOL_BY_TYPE = tuple(_TISSUE_PROTOCOLS[tissue_type] for tissue_type in BiologicalTargetType)
+_MAX_SAFE_FORCE_BY_TYPE = np.array([
+    _TISSUE_PROTOCOLS[tissue_type]['max_force'] / _TISSUE_PROTOCOLS[tissue_type]['safety_factor']
+    for tissue_type in BiologicalTargetType
+])
+_EMERGENCY_THRESHOLD_BY_TYPE = np.array([
+    _TISSUE_PROTOCOLS[tissue_type]['emergency_threshold'] for tissue_type in BiologicalTargetType
+])
+_MONITORING_FREQUENCY_BY_TYPE = np.array([
+    _TISSUE_PROTOCOLS[tissue_type]['monitoring_frequency'] for tissue_type in BiologicalTargetType
+])
+
 @dataclass
 class LQGMedicalMetrics:
     """Real-time metrics for LQG-enhanced medical operations"""
@@ -111,7 +178,8 @@ class LQGMedicalTractorArray:
     def __init__(self, 
                  array_dimensions: Tuple[float, float, float] = (2.0, 2.0, 1.5),
                  field_resolution: int = 128,
-                 safety_protocols: Optional[BiologicalSafetyProtocols] = None):
+                 safety_protocols: Optional[BiologicalSafetyProtocols] = None,
+                 enable_monitor_thread: bool = True):
         """
         Initialize Revolutionary LQG-Enhanced Medical Tractor Array
         
@@ -119,11 +187,13 @@ class LQGMedicalTractorArray:
             array_dimensions: (x, y, z) dimensions in meters for medical workspace
             field_resolution: Spatial resolution for field computation (128³ default)
             safety_protocols: Biological safety configuration
+            enable_monitor_thread: Start background safety and UQ monitoring threads
         """
         self.logger = logging.getLogger(__name__)
         self.array_dimensions = np.array(array_dimensions)
         self.field_resolution = field_resolution
         self.safety_protocols = safety_protocols or BiologicalSafetyProtocols()
+        self.monitor_threads_enabled = enable_monitor_thread
         
         # Initialize Revolutionary LQG polymer parameters for 453M× energy reduction
         self.planck_length = 1.616e-35  # meters
@@ -419,7 +489,7 @@ class LQGMedicalTractorArray:
             Validated force vector with positive-energy guarantee
         """
         # Compute stress-energy tensor from force field
-        force_magnitude = np.linalg.norm(force_vector)
+        force_magnitude = _norm3(force_vector)
         
         # Tissue-specific safety limits with positive-energy enforcement
         tissue_safety_limits = {
@@ -459,65 +529,16 @@ class LQGMedicalTractorArray:
             Tuple of (safe_force, protocol_results)
         """
         tissue_type = target.biological_type
+        type_index = _TISSUE_INDEX.get(tissue_type, _DEFAULT_TISSUE_INDEX)
+        protocol = _PROTOCOL_BY_TYPE[type_index]
         
-        # Revolutionary tissue-specific safety protocols
-        tissue_protocols = {
-            BiologicalTargetType.NEURAL_TISSUE: {
-                'max_force': 1e-15,        # 0.001 pN for neural safety
-                'max_acceleration': 1e-6,   # Extremely gentle acceleration
-                'safety_factor': 1000.0,    # Ultra-high safety margin
-                'monitoring_frequency': 20000,  # 20 kHz for neural monitoring
-                'emergency_threshold': 1e-16    # Hair-trigger emergency response
-            },
-            BiologicalTargetType.BLOOD_VESSEL: {
-                'max_force': 1e-14,        # 0.01 pN for vascular safety
-                'max_acceleration': 1e-5,   # Gentle vascular manipulation
-                'safety_factor': 500.0,     # High safety margin
-                'monitoring_frequency': 15000,  # 15 kHz monitoring
-                'emergency_threshold': 1e-15
-            },
-            BiologicalTargetType.CELL: {
-                'max_force': 1e-13,        # 0.1 pN for cellular manipulation
-                'max_acceleration': 1e-4,   # Cellular-safe acceleration
-                'safety_factor': 100.0,     # Standard safety margin
-                'monitoring_frequency': 10000,  # 10 kHz monitoring
-                'emergency_threshold': 1e-14
-            },
-            BiologicalTargetType.TISSUE: {
-                'max_force': 1e-12,        # 1 pN for tissue manipulation
-                'max_acceleration': 1e-3,   # Tissue-safe acceleration
-                'safety_factor': 50.0,      # Moderate safety margin
-                'monitoring_frequency': 5000,   # 5 kHz monitoring
-                'emergency_threshold': 1e-13
-            },
-            BiologicalTargetType.ORGAN: {
-                'max_force': 1e-11,        # 10 pN for organ manipulation
-                'max_acceleration': 1e-2,   # Organ-level acceleration
-                'safety_factor': 25.0,      # Reduced safety margin
-                'monitoring_frequency': 2000,   # 2 kHz monitoring
-                'emergency_threshold': 1e-12
-            },
-            BiologicalTargetType.SURGICAL_TOOL: {
-                'max_force': 1e-9,         # 1 nN for surgical tools
-                'max_acceleration': 0.1,    # Tool manipulation acceleration
-                'safety_factor': 5.0,       # Minimal safety margin
-                'monitoring_frequency': 1000,   # 1 kHz monitoring
-                'emergency_threshold': 1e-10
-            }
-        }
-        
-        protocol = tissue_protocols.get(tissue_type, tissue_protocols[BiologicalTargetType.TISSUE])
+        # Apply force limiting with tissue-specific protocols; the scale is exactly
+        # 1.0 for forces within the limit, so no branch on the magnitude is needed
+        force_magnitude = _norm3(manipulation_force)
+        max_safe_force = _MAX_SAFE_FORCE_BY_TYPE[type_index]
         
-        # Apply force limiting with tissue-specific protocols
-        force_magnitude = np.linalg.norm(manipulation_force)
-        max_safe_force = protocol['max_force'] / protocol['safety_factor']
-        
-        if force_magnitude > max_safe_force:
-            safe_force = manipulation_force * (max_safe_force / force_magnitude)
-            force_limited = True
-        else:
-            safe_force = manipulation_force
-            force_limited = False
+        force_limited = bool(force_magnitude > max_safe_force)
+        safe_force = manipulation_force * (max_safe_force / max(force_magnitude, max_safe_force))
             
         # Enhanced Simulation Framework validation for tissue-specific protocols
         if self.framework_instance:
@@ -543,10 +564,10 @@ class LQGMedicalTractorArray:
         
         protocol_results = {
             'tissue_type': tissue_type.value,
-            'protocol_applied': protocol,
+            'protocol_applied': dict(protocol),
             'force_limited': force_limited,
             'original_force_magnitude': force_magnitude,
-            'safe_force_magnitude': np.linalg.norm(safe_force),
+            'safe_force_magnitude': _norm3(safe_force),
             'framework_validated': framework_validated,
             'framework_recommendations': framework_recommendations,
             'emergency_threshold': protocol['emergency_threshold'],
@@ -554,6 +575,46 @@ class LQGMedicalTractorArray:
         }
         
         return safe_force, protocol_results
+    
+    def _apply_tissue_specific_medical_protocols_batch(self, biological_types: List[BiologicalTargetType],
+                                                     manipulation_forces: np.ndarray) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Apply tissue-specific force limits to many targets at once
+        
+        Vectorized counterpart of _apply_tissue_specific_medical_protocols covering
+        force limiting only; Enhanced Simulation Framework validation stays per target.
+        
+        Args:
+            biological_types: Tissue type of each target
+            manipulation_forces: Proposed manipulation forces, shape (N, 3)
+            
+        Returns:
+            Tuple of (safe_forces, protocol_results) with per-target result arrays
+        """
+        type_indices = np.fromiter((_TISSUE_INDEX.get(tissue_type, _DEFAULT_TISSUE_INDEX)
+                                    for tissue_type in biological_types),
+                                   dtype=np.intp, count=len(biological_types))
+        manipulation_forces = np.asarray(manipulation_forces, dtype=float)
+        
+        force_magnitudes = np.linalg.norm(manipulation_forces, axis=1)
+        max_safe_forces = _MAX_SAFE_FORCE_BY_TYPE[type_indices]
+        
+        # Scale each force down to its tissue limit; forces within the limit pass unchanged
+        force_limited = force_magnitudes > max_safe_forces
+        scale = np.ones_like(force_magnitudes)
+        np.divide(max_safe_forces, force_magnitudes, out=scale, where=force_limited)
+        safe_forces = manipulation_forces * scale[:, None]
+        
+        protocol_results = {
+            'tissue_type': [tissue_type.value for tissue_type in biological_types],
+            'force_limited': force_limited,
+            'original_force_magnitude': force_magnitudes,
+            'safe_force_magnitude': np.linalg.norm(safe_forces, axis=1),
+            'emergency_threshold': _EMERGENCY_THRESHOLD_BY_TYPE[type_indices],
+            'monitoring_frequency': _MONITORING_FREQUENCY_BY_TYPE[type_indices]
+        }
+        
+        return safe_forces, protocol_results
         
     def _initialize_medical_control_matrix(self) -> np.ndarray:
         """Initialize medical-grade control matrix for precise LQG manipulation"""
@@ -593,10 +654,18 @@ class LQGMedicalTractorArray:
     def _initialize_comprehensive_safety_systems(self):
         """Initialize comprehensive biological safety monitoring with real-time UQ validation"""
         self.safety_monitoring_active = True
+        self._stop_event = threading.Event()  # Wakes monitoring threads on shutdown
         self.safety_violations = []
         self.emergency_protocols_armed = True
         self.causality_violations = []
         
+        self.safety_thread = None
+        self.uq_monitoring_thread = None
+        
+        if not self.monitor_threads_enabled:
+            self.logger.info("Comprehensive biological safety systems initialized without monitoring threads")
+            return
+        
         # Real-time safety monitoring thread with medical-grade responsiveness
         self.safety_thread = threading.Thread(target=self._continuous_safety_monitoring, daemon=True)
         self.safety_thread.start()
@@ -777,6 +846,7 @@ class LQGMedicalTractorArray:
             
         # Deactivate all monitoring systems safely
         self.safety_monitoring_active = False
+        self._stop_event.set()
         
         shutdown_time = time.time() - shutdown_start
         
@@ -934,13 +1004,14 @@ class LQGMedicalTractorArray:
             
             # Update target position with LQG-enhanced precision
             target.position = desired_pos.copy()
+            precision_achieved_nm = _norm3(displacement) * 1e9  # Convert to nanometers
             
             # Record LQG enhancement metrics
             manipulation_metrics['lqg_enhancements_applied'].append({
                 'waypoint': i,
                 'time': t,
                 'energy_reduction': enhancement_metrics['energy_reduction_factor'],
-                'precision_achieved_nm': np.linalg.norm(displacement) * 1e9,  # Convert to nanometers
+                'precision_achieved_nm': precision_achieved_nm,
                 'framework_active': enhancement_metrics['framework_active']
             })
             
@@ -948,7 +1019,7 @@ class LQGMedicalTractorArray:
             manipulation_metrics['total_energy_reduction'] += enhancement_metrics['energy_reduction_factor']
             manipulation_metrics['max_precision_achieved_nm'] = max(
                 manipulation_metrics['max_precision_achieved_nm'],
-                np.linalg.norm(displacement) * 1e9
+                precision_achieved_nm
             )
             
             # Small delay for real-time execution simulation
@@ -985,7 +1056,7 @@ class LQGMedicalTractorArray:
     def _comprehensive_post_manipulation_validation(self, target: MedicalTarget, 
                                                   desired_position: np.ndarray) -> Dict[str, float]:
         """Revolutionary post-manipulation validation with Enhanced Simulation Framework metrics"""
-        position_error = np.linalg.norm(target.position - desired_position)
+        position_error = _norm3(target.position - desired_position)
         precision_achieved_nm = position_error * 1e9  # Convert to nanometers
         
         # Enhanced metrics with framework integration
@@ -1023,12 +1094,24 @@ class LQGMedicalTractorArray:
         
         return validation_metrics
         
+    def stop_monitoring(self, timeout: float = 1.0):
+        """Stop the background monitoring threads and wait up to timeout in total for them to exit"""
+        self.safety_monitoring_active = False
+        self._stop_event.set()
+        
+        # Both threads were signalled together, so they share one deadline
+        deadline = time.monotonic() + timeout
+        for thread in (self.safety_thread, self.uq_monitoring_thread):
+            if thread and thread.is_alive() and thread is not threading.current_thread():
+                thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        
     def _continuous_safety_monitoring(self):
         """Background safety monitoring"""
         while self.safety_monitoring_active:
             if self.emergency_stop:
                 break
-            time.sleep(0.01)  # 10ms monitoring cycle
+            if self._stop_event.wait(timeout=0.01):  # 10ms monitoring cycle
+                break
             
     def _continuous_uq_monitoring(self):
         """Background UQ monitoring"""
@@ -1036,7 +1119,8 @@ class LQGMedicalTractorArray:
             # Update metrics
             self.metrics.causality_preservation = 0.999
             self.metrics.positive_energy_compliance = 1.0
-            time.sleep(0.1)  # 100ms UQ monitoring cycle
+            if self._stop_event.wait(timeout=0.1):  # 100ms UQ monitoring cycle
+                break
 
 if __name__ == "__main__":
     # Configure logging for revolutionary medical deployment